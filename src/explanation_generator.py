@@ -80,7 +80,7 @@ class ExplanationGenerator:
         prompt = f"Explain the following SHACL violation in {language} (ISO 639-1 code): {violation.message or 'Unknown violation'}. "
         prompt += f"Justification: {json.dumps(justification_tree.to_dict(), indent=2, default=str)}. "
         prompt += (
-            f"Relevant context: {json.dumps(context.__dict__, indent=2, default=str)}. "
+            f"Relevant context: {json.dumps(context.to_dict(), indent=2, default=str)}. "
         )
         prompt += explanations_prompt
 
@@ -104,7 +104,7 @@ class ExplanationGenerator:
         SUGGESTION_SEPARATOR = "\n\n" # Define separator consistently
 
         prompt = f"Consider the following SHACL violation (context language is {language}, ISO 639-1 code): {violation.message or 'Unknown violation'}.\n"
-        prompt += f"Relevant context: {json.dumps(context.__dict__, indent=2, default=str)}.\n\n"
+        prompt += f"Relevant context: {json.dumps(context.to_dict(), indent=2, default=str)}.\n\n"
         prompt += f"Provide possible correction suggestions for this violation IN THE LANGUAGE '{language.upper()}' (ISO 639-1 code: {language}). Combine all suggestions into a single response, perhaps using numbered points or distinct paragraphs.\n\n"
         prompt += suggestions_prompt # Append the original detailed instructions
 
@@ -229,7 +229,7 @@ class LocalExplanationGenerator:
             prompt_explanation = f"Explain the following SHACL violation in {lang}: {violation.message or 'Unknown violation'}. "
             prompt_explanation += f"Justification: {json.dumps(justification_tree.to_dict(), indent=2, default=str)}. "
             prompt_explanation += (
-                f"Relevant context: {json.dumps(context.__dict__, indent=2, default=str)}. "
+                f"Relevant context: {json.dumps(context.to_dict(), indent=2, default=str)}. "
             )
             prompt_explanation += explanations_prompt
 
@@ -242,7 +242,7 @@ class LocalExplanationGenerator:
 
             prompt_suggestions = f"Given the following SHACL violation in {lang}: {violation.message or 'Unknown violation'}. "
             prompt_suggestions += (
-                f"Relevant context: {json.dumps(context.__dict__, indent=2, default=str)}. "
+                f"Relevant context: {json.dumps(context.to_dict(), indent=2, default=str)}. "
             )
             prompt_suggestions += suggestions_prompt
 
@@ -262,7 +262,7 @@ class LocalExplanationGenerator:
         """Generates correction suggestions for a violation using Ollama for a specific language"""
         prompt = f"Given the following SHACL violation in {language} (ISO 639-1 code): {violation.message or 'Unknown violation'}. "
         prompt += (
-            f"Relevant context: {json.dumps(context.__dict__, indent=2, default=str)}. "
+            f"Relevant context: {json.dumps(context.to_dict(), indent=2, default=str)}. "
         )
         prompt += suggestions_prompt
 
@@ -1,8 +1,11 @@
 import os
-import json
 import logging
 import hashlib 
-from typing import Dict, Set, Optional, List 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Set, Optional, List, Tuple
 
 from dataclasses import dataclass, field
 from xpshacl_architecture import (
@@ -13,9 +16,11 @@ from xpshacl_architecture import (
     JustificationNode,
 )
 
+import msgspec
 import rdflib
 from rdflib import Namespace, Graph, Literal, URIRef
 from rdflib.namespace import RDF, RDFS
+from rdflib.util import guess_format
 
 from violation_signature import ViolationSignature 
 
@@ -23,99 +28,368 @@ logger = logging.getLogger("xpshacl.violation_kg")
 
 XSH = Namespace("http://xpshacl.org/#")
 
+# Terms used on the hot add/query paths, resolved once instead of per access
+P_TYPE = RDF.type
+T_VIOLATION_SIG = XSH.ViolationSignature
+T_EXPLANATION = XSH.Explanation
+P_HAS_EXPLANATION = XSH.hasExplanation
+P_CONSTRAINT_COMPONENT = XSH.constraintComponent
+P_PROPERTY_PATH = XSH.propertyPath
+P_VIOLATION_TYPE = XSH.violationType
+P_CONSTRAINT_PARAMS = XSH.constraintParams
+P_NATURAL_LANGUAGE_TEXT = XSH.naturalLanguageText
+P_CORRECTION_SUGGESTIONS = XSH.correctionSuggestions
+P_PROVIDED_BY_MODEL = XSH.providedByModel
+P_VIOLATION = XSH.violation
+P_JUSTIFICATION_TREE = XSH.justificationTree
+P_RETRIEVED_CONTEXT = XSH.retrievedContext
+
 # Define the separator used for joining/splitting suggestions
 SUGGESTION_SEPARATOR = "\n\n"
 
+
+@dataclass(slots=True)
+class _StoredJustificationTree:
+    """Layout of a stored justificationTree literal (as produced by JustificationTree.to_dict)."""
+
+    justification: JustificationNode
+    violation: Optional[ConstraintViolation] = None
+
+
+# Typed msgspec codecs for the JSON literals attached to explanation nodes.
+# Unknown value types fall back to str(), like json.dumps(default=str) did.
+_json_encoder = msgspec.json.Encoder(enc_hook=str)
+_violation_decoder = msgspec.json.Decoder(ConstraintViolation)
+_justification_tree_decoder = msgspec.json.Decoder(_StoredJustificationTree)
+_context_decoder = msgspec.json.Decoder(DomainContext)
+
+
+# The encoder accepts any JSON-native value, while the typed decoders enforce the
+# annotations (e.g. ConstraintViolation.value: Optional[str]). Payloads that do not
+# match are still valid JSON, so they fall back to the lenient from_dict path.
+def _decode_violation(data: str) -> ConstraintViolation:
+    try:
+        return _violation_decoder.decode(data)
+    except msgspec.ValidationError:
+        return ConstraintViolation.from_dict(msgspec.json.decode(data))
+
+
+def _decode_justification_tree(data: str) -> Tuple[JustificationNode, Optional[ConstraintViolation]]:
+    """Return the tree's root node and its embedded violation (None if that cannot be decoded)."""
+    try:
+        stored_tree = _justification_tree_decoder.decode(data)
+        return stored_tree.justification, stored_tree.violation
+    except msgspec.ValidationError:
+        raw = msgspec.json.decode(data)
+        root = JustificationNode.from_dict(raw["justification"])
+        embedded_violation = None
+        if raw.get("violation"):
+            try:
+                embedded_violation = ConstraintViolation.from_dict(raw["violation"])
+            except Exception: pass # Ignore if embedded violation fails
+        return root, embedded_violation
+
+
+def _decode_context(data: str) -> DomainContext:
+    try:
+        return _context_decoder.decode(data)
+    except msgspec.ValidationError:
+        return DomainContext.from_dict(msgspec.json.decode(data))
+
+
+# Pre-seeded hash state for signature URIs; copying it is cheaper than building
+# a fresh hasher, and the version prefix keeps room for future format changes.
+_SIG_HASHER = hashlib.blake2b(digest_size=16)
+_SIG_HASHER.update(b"xshacl-sig|v1|")
+
+
+@lru_cache(maxsize=65536)
+def _sig_uri(
+    constraint_id: str,
+    property_path: str,
+    violation_type: str,
+    canonical_params: bytes,
+) -> URIRef:
+    """Hash the (hashable) signature components into a stable XSH URI."""
+    h = _SIG_HASHER.copy()
+    h.update(constraint_id.encode("utf-8"))
+    h.update(b"|")
+    h.update(property_path.encode("utf-8"))
+    h.update(b"|")
+    h.update(violation_type.encode("utf-8"))
+    h.update(b"|")
+    h.update(canonical_params)
+    return XSH[f"sig_{h.hexdigest()}"]
+
+
 class ViolationKnowledgeGraph:
     def __init__(
         self,
         ontology_path: str = "data/xpshacl_ontology.ttl",
-        kg_path: str = "data/validation_kg.ttl",
+        kg_path: str = "data/validation_kg.nt",
+        explanation_cache_size: int = 1024,
+        store: str = "default",
     ):
+        """
+        With the default in-memory store the ABox is loaded from and saved to the
+        N-Triples file at kg_path. Any other RDFLib store plugin (e.g. "BerkeleyDB")
+        is opened persistently with kg_path as its configuration (a directory for
+        BerkeleyDB): triples are written through on add and nothing is re-serialized.
+        Writing to self.graph directly is supported but slow: the in-memory indexes
+        are rebuilt on the next lookup and the next save rewrites the whole file.
+        """
         self.ontology_path = ontology_path
         self.kg_path = kg_path
-        self.graph = rdflib.Graph()
+        self.store = store
+        self._persistent = store != "default"
+        # The ontology (TBox) is read-only at runtime and kept apart from the
+        # violation instance data (ABox) so that only the latter is serialized.
+        self.tbox = rdflib.Graph()
+        self.tbox.bind("xsh", XSH)
+        if self._persistent:
+            self.graph = rdflib.Graph(store=store, identifier=XSH["violation_kg"])
+            self.graph.open(self.kg_path, create=True)
+        else:
+            self.graph = rdflib.Graph()
         self.graph.bind("xsh", XSH)
 
+        # Batch-mode state: save_kg() calls are deferred while _batch_depth > 0
+        self._batch_depth = 0
+        self._save_pending = False
+
+        # Append-only persistence: triples added since the last save, and whether
+        # the KG file must be fully rewritten (after removals, clear or reload).
+        # The graph object and its size at the last load/save let save_kg() notice
+        # triples written to self.graph directly, which bypass _pending_triples.
+        self._pending_triples: List[Tuple] = []
+        self._needs_rewrite = False
+        self._saved_graph: Optional[rdflib.Graph] = None
+        self._saved_len = 0
+
+        # LRU cache of reconstructed explanations: sig_uri -> {language: ExplanationOutput}
+        self.explanation_cache_size = explanation_cache_size
+        self._explanation_cache: "OrderedDict[URIRef, Dict[str, ExplanationOutput]]" = OrderedDict()
+
         # Load the ontology definitions (TBox) - improved loading
         try:
              if os.path.exists(self.ontology_path):
-                 self.graph.parse(self.ontology_path, format="turtle")
+                 self.tbox.parse(self.ontology_path, format="turtle")
              else:
                  logger.warning(f"Ontology file not found at {self.ontology_path}, skipping load.")
         except Exception as e:
             logger.error(f"Error parsing ontology file {self.ontology_path}: {e}")
 
         # If there's existing instance data, load it - improved loading
-        try:
-            if os.path.exists(self.kg_path):
-                self.graph.parse(self.kg_path, format="turtle")
-            # No need for else, just pass if file doesn't exist
-        except FileNotFoundError:
-            pass # Expected if KG doesn't exist yet
-        except Exception as e:
-             logger.error(f"Error parsing KG file {self.kg_path}: {e}")
+        self._load_abox()
 
     def save_kg(self):
-        """Serialize the instance data."""
+        """
+        Persist the instance data (deferred until the outermost batch ends).
+        Newly added triples are appended to the KG file; the whole ABox is only
+        re-serialized when triples were removed since the last save.
+        """
+        if self._batch_depth > 0:
+            self._save_pending = True
+            return
+        self._save_pending = False
+        if self._persistent:
+            # Triples already live in the store; only flush it to disk
+            try:
+                self.graph.commit()
+                if hasattr(self.graph.store, "sync"):
+                    self.graph.store.sync()
+            except Exception as e:
+                logger.error(f"Failed to flush KG store {self.store} at {self.kg_path}: {e}")
+            return
         try:
             # Ensure directory exists before saving
             os.makedirs(os.path.dirname(self.kg_path), exist_ok=True)
-            self.graph.serialize(destination=self.kg_path, format="turtle")
+            modified_directly = (
+                self.graph is not self._saved_graph
+                or len(self.graph) != self._saved_len + len(self._pending_triples)
+            )
+            if self._needs_rewrite or modified_directly or not os.path.exists(self.kg_path):
+                # N-Triples: the KG file is a machine-only cache, and the line-based
+                # serializer is much cheaper than Turtle's prefix compaction.
+                self.graph.serialize(destination=self.kg_path, format="nt", encoding="utf-8")
+            elif self._pending_triples:
+                delta = rdflib.Graph()
+                for triple in self._pending_triples:
+                    delta.add(triple)
+                with open(self.kg_path, "ab") as kg_file:
+                    kg_file.write(delta.serialize(format="nt", encoding="utf-8"))
+            self._pending_triples = []
+            self._needs_rewrite = False
+            self._saved_graph = self.graph
+            self._saved_len = len(self.graph)
         except Exception as e:
             logger.error(f"Failed to save KG to {self.kg_path}: {e}")
 
-    def load_kg(self):
-        """Load the RDF graph from the TTL file (if it exists). Clears existing graph."""
-        self.graph = rdflib.Graph()
-        self.graph.bind("xsh", XSH)
+    def _add_all(self, triples: List[Tuple]):
+        """
+        Bulk-add triples to the ABox (one graph.addN call) and the indexes, and
+        queue them for the next (append-only) save. Known triples are skipped.
+        A persistent store is written through, so nothing is indexed or queued.
+        """
+        new_triples = []
+        for s, p, o in triples:
+            if self._persistent:
+                if (s, p, o) in self.graph:
+                    continue
+            else:
+                objects = self._index.setdefault(s, {}).setdefault(p, [])
+                if o in objects:
+                    continue
+                objects.append(o)
+                if p == P_TYPE and o == T_VIOLATION_SIG:
+                    self._known_sigs.add(s)
+            new_triples.append((s, p, o))
+        if new_triples:
+            self.graph.addN((s, p, o, self.graph) for s, p, o in new_triples)
+            if not self._persistent:
+                self._pending_triples.extend(new_triples)
+                self._indexed_len = len(self.graph)
+
+    def _remove(self, subject, predicate):
+        """Remove all (subject, predicate, *) triples from the ABox and the indexes."""
+        self.graph.remove((subject, predicate, None))
+        if not self._persistent:
+            self._index.get(subject, {}).pop(predicate, None)
+            self._indexed_len = len(self.graph)
+            self._needs_rewrite = True # Removal cannot be expressed as an append
+
+    def begin_batch(self):
+        """Start a batch; saves requested until the matching end_batch() are deferred."""
+        self._batch_depth += 1
+
+    def end_batch(self):
+        """End a batch, flushing a single deferred save once the outermost batch ends."""
+        if self._batch_depth == 0:
+            raise RuntimeError("end_batch() called without a matching begin_batch()")
+        self._batch_depth -= 1
+        if self._batch_depth == 0 and self._save_pending:
+            self.save_kg()
+
+    @contextmanager
+    def batch(self):
+        """Context manager wrapping begin_batch()/end_batch() for bulk updates."""
+        self.begin_batch()
         try:
-            if os.path.exists(self.ontology_path):
-                self.graph.parse(self.ontology_path, format="turtle")
-        except Exception as e:
-             logger.error(f"Error parsing ontology file {self.ontology_path} during load_kg: {e}")
+            yield self
+        finally:
+            self.end_batch()
 
-        # Load KG data
+    def load_kg(self):
+        """Reload the instance data from the KG file (if it exists). Clears existing instance data."""
+        if not self._persistent:
+            self.graph = rdflib.Graph()
+            self.graph.bind("xsh", XSH)
+        self._pending_triples = []
+        self._needs_rewrite = False
+        self._explanation_cache.clear()
+        self._load_abox()
+
+    def _load_abox(self):
+        """Parse the KG file into the ABox graph and rebuild the in-memory indexes."""
         try:
-            if os.path.exists(self.kg_path):
-                self.graph.parse(self.kg_path, format="turtle")
+            if not self._persistent and os.path.exists(self.kg_path):
+                # N-Triples is also valid Turtle, so legacy .ttl paths keep working
+                self.graph.parse(self.kg_path, format=guess_format(self.kg_path) or "nt")
+                # KG files written before the TBox/ABox split embed the ontology
+                self.graph -= self.tbox
         except FileNotFoundError:
             pass # It's okay if the KG file doesn't exist yet
         except Exception as e:
-             logger.error(f"Error parsing KG file {self.kg_path} during load_kg: {e}")
+             logger.error(f"Error parsing KG file {self.kg_path}: {e}")
+             self._needs_rewrite = True # Never append to a file we could not read
 
+        self._saved_graph = self.graph
+        self._saved_len = len(self.graph)
+        self._build_indexes()
+
+    def _build_indexes(self):
+        """
+        Rebuild the in-memory indexes from the ABox in a single pass: the set of
+        known signature URIs and a subject -> predicate -> [objects] index that
+        serves all signature/explanation lookups without probing the RDFLib store.
+        A persistent store keeps its triples on disk, so nothing is held in memory
+        and lookups go to the store instead.
+        """
+        self._known_sigs: Set[URIRef] = set()
+        self._index: Dict[Any, Dict[URIRef, List[Any]]] = {}
+        # Graph object and size the indexes were built for (see _sync_indexes)
+        self._indexed_graph = self.graph
+        self._indexed_len = 0
+        if self._persistent:
+            return
+        for s, p, o in self.graph:
+            self._index.setdefault(s, {}).setdefault(p, []).append(o)
+            if p == P_TYPE and o == T_VIOLATION_SIG:
+                self._known_sigs.add(s)
+        self._indexed_len = len(self.graph)
+
+    def _sync_indexes(self):
+        """
+        Rebuild the indexes (and drop cached explanations) if self.graph was
+        replaced or written to directly since they were last updated. Every
+        change made through this class keeps _indexed_len in step with the graph.
+        """
+        if self._persistent:
+            return
+        if self.graph is not self._indexed_graph or len(self.graph) != self._indexed_len:
+            logger.debug("ABox changed outside the KG API, rebuilding indexes")
+            self._explanation_cache.clear()
+            self._build_indexes()
+
+    def _is_known(self, sig_uri: URIRef) -> bool:
+        """Whether a violation signature node with this URI exists in the ABox."""
+        if self._persistent:
+            return (sig_uri, P_TYPE, T_VIOLATION_SIG) in self.graph
+        self._sync_indexes()
+        return sig_uri in self._known_sigs
+
+    def _value(self, subject, predicate):
+        """Indexed equivalent of graph.value(subject, predicate)."""
+        if self._persistent:
+            return self.graph.value(subject, predicate)
+        objects = self._index.get(subject, {}).get(predicate)
+        return objects[0] if objects else None
+
+    def _objects(self, subject, predicate) -> List[Any]:
+        """Indexed equivalent of graph.objects(subject, predicate)."""
+        if self._persistent:
+            return list(self.graph.objects(subject, predicate))
+        return self._index.get(subject, {}).get(predicate, [])
 
     def signature_to_uri(self, sig: ViolationSignature) -> URIRef:
-        """Create a stable URIRef for a given signature."""
-        # Ensure constraint_params is treated consistently (dict or None)
-        params = sig.constraint_params if sig.constraint_params else {}
-        sorted_params = sorted(params.items())
+        """Create a stable URIRef for a given signature (memoized per signature)."""
         # Ensure consistent handling of None for paths/types
         property_path_str = str(sig.property_path) if sig.property_path else "None"
         # Convert violation_type enum/object to string if necessary
         violation_type_str = str(sig.violation_type) if sig.violation_type else "None"
 
-        signature_string = (
-            f"{sig.constraint_id}|{property_path_str}|{violation_type_str}|{sorted_params}"
+        return _sig_uri(
+            sig.constraint_id,
+            property_path_str,
+            violation_type_str,
+            sig.canonical_params,
         )
-        hex_digest = hashlib.md5(signature_string.encode("utf-8")).hexdigest()
-        return XSH[f"sig_{hex_digest}"]
 
     def has_violation(self, sig: ViolationSignature, language: str = "en") -> bool:
         """Check if a node in the KG exists with the same signature and language."""
         sig_uri = self.signature_to_uri(sig)
 
-        # Check if the signature node itself exists
-        if not (sig_uri, RDF.type, XSH.ViolationSignature) in self.graph:
+        # Check if the signature node itself exists (set probe, no triple lookup)
+        if not self._is_known(sig_uri):
             return False
 
         # Find the linked Explanation node
-        expl_uri = self.graph.value(subject=sig_uri, predicate=XSH.hasExplanation)
+        expl_uri = self._value(sig_uri, P_HAS_EXPLANATION)
         if not expl_uri:
             return False # Signature exists, but no linked explanation
 
         # Check for the specific language explanation text by iterating
-        for obj in self.graph.objects(subject=expl_uri, predicate=XSH.naturalLanguageText):
+        for obj in self._objects(expl_uri, P_NATURAL_LANGUAGE_TEXT):
             if isinstance(obj, Literal) and obj.language == language:
                 return True # Found an explanation in the target language
 
@@ -125,25 +399,46 @@ class ViolationKnowledgeGraph:
         """
         Retrieve the explanation from the KG for a given signature and language.
         Assumes suggestions are stored as a single combined literal per language.
+        Reconstructed explanations are kept in an LRU cache keyed by signature URI.
         """
         sig_uri = self.signature_to_uri(sig)
 
+        # Fast negative path: most signatures of a fresh dataset are unknown
+        if not self._is_known(sig_uri):
+            logger.debug(f"Signature {sig_uri} not in KG")
+            return None
+
+        cached = self._explanation_cache.get(sig_uri)
+        if cached is not None and language in cached:
+            self._explanation_cache.move_to_end(sig_uri)
+            return cached[language]
+
+        explanation = self._build_explanation(sig_uri, language)
+        if explanation is not None and self.explanation_cache_size > 0:
+            self._explanation_cache.setdefault(sig_uri, {})[language] = explanation
+            self._explanation_cache.move_to_end(sig_uri)
+            if len(self._explanation_cache) > self.explanation_cache_size:
+                self._explanation_cache.popitem(last=False)
+        return explanation
+
+    def _build_explanation(self, sig_uri: URIRef, language: str) -> Optional[ExplanationOutput]:
+        """Reconstruct an ExplanationOutput for a signature URI from the KG."""
         # Find the linked Explanation node
-        expl_uri = self.graph.value(subject=sig_uri, predicate=XSH.hasExplanation)
+        expl_uri = self._value(sig_uri, P_HAS_EXPLANATION)
         if expl_uri is None:
              logger.debug(f"No explanation URI found for signature {sig_uri}")
              return None
 
         # Find language-specific natural language text by iterating
         nlt_literal = None
-        for obj in self.graph.objects(subject=expl_uri, predicate=XSH.naturalLanguageText):
+        for obj in self._objects(expl_uri, P_NATURAL_LANGUAGE_TEXT):
              if isinstance(obj, Literal) and obj.language == language:
                  nlt_literal = obj
                  break # Found the one for the specific language
 
         # Find language-specific correction suggestions (single literal) by iterating
         cs_combined: Optional[str] = None
-        for obj in self.graph.objects(subject=expl_uri, predicate=XSH.correctionSuggestions):
+        for obj in self._objects(expl_uri, P_CORRECTION_SUGGESTIONS):
             if isinstance(obj, Literal) and obj.language == language:
                  cs_combined = str(obj)
                  break # Found the combined suggestions for the specific language
@@ -157,42 +452,35 @@ class ViolationKnowledgeGraph:
             return None
 
         # Retrieve other potentially language-independent data
-        provided_by_model = self.graph.value(subject=expl_uri, predicate=XSH.providedByModel)
-        violation_data = self.graph.value(subject=expl_uri, predicate=XSH.violation)
-        justification_tree_data = self.graph.value(subject=expl_uri, predicate=XSH.justificationTree)
-        retrieved_context_data = self.graph.value(subject=expl_uri, predicate=XSH.retrievedContext)
+        provided_by_model = self._value(expl_uri, P_PROVIDED_BY_MODEL)
+        violation_data = self._value(expl_uri, P_VIOLATION)
+        justification_tree_data = self._value(expl_uri, P_JUSTIFICATION_TREE)
+        retrieved_context_data = self._value(expl_uri, P_RETRIEVED_CONTEXT)
 
         # Attempt to deserialize complex objects with error handling
         violation = None
         if violation_data:
              try:
-                 violation = ConstraintViolation.from_dict(json.loads(str(violation_data)))
+                 violation = _decode_violation(str(violation_data))
              except Exception as e:
                  logger.error(f"Failed to decode/instantiate ConstraintViolation for {expl_uri}: {e}")
 
         justification_tree = None
         if justification_tree_data:
              try:
-                 justification_tree_dict = json.loads(str(justification_tree_data))
-                 temp_violation_for_tree = violation
-                 if not temp_violation_for_tree and "violation" in justification_tree_dict:
-                      try:
-                          temp_violation_for_tree = ConstraintViolation.from_dict(justification_tree_dict["violation"])
-                      except Exception: pass # Ignore if embedded violation fails
-
-                 if "justification" in justification_tree_dict and temp_violation_for_tree:
-                     root_node = JustificationNode.from_dict(justification_tree_dict["justification"])
-                     justification_tree = JustificationTree(root=root_node, violation=temp_violation_for_tree)
+                 root_node, embedded_violation = _decode_justification_tree(str(justification_tree_data))
+                 tree_violation = violation or embedded_violation
+                 if tree_violation:
+                     justification_tree = JustificationTree(root=root_node, violation=tree_violation)
                  else:
-                      logger.warning(f"Could not reconstruct JustificationTree for {expl_uri}: Missing 'justification' key or associated violation.")
+                      logger.warning(f"Could not reconstruct JustificationTree for {expl_uri}: Missing associated violation.")
              except Exception as e:
                   logger.error(f"Failed to decode/instantiate JustificationTree for {expl_uri}: {e}")
 
         retrieved_context = None
         if retrieved_context_data:
              try:
-                 # Assuming DomainContext.from_dict can handle the serialized format
-                 retrieved_context = DomainContext.from_dict(json.loads(str(retrieved_context_data)))
+                 retrieved_context = _decode_context(str(retrieved_context_data))
              except Exception as e:
                  logger.error(f"Failed to decode/instantiate DomainContext for {expl_uri}: {e}")
 
@@ -211,43 +499,111 @@ class ViolationKnowledgeGraph:
         Combines correction suggestions into a single literal per language.
         Prevents adding duplicate language-tagged text/suggestions.
         """
-        sig_uri = self.signature_to_uri(sig)
-        SUGGESTION_SEPARATOR = "\n\n" # Define separator here or globally
+        self._insert_violation(self.signature_to_uri(sig), sig, explanation, language)
 
-        # Check if an explanation node exists for this signature, create if not
-        expl_uri = self.graph.value(subject=sig_uri, predicate=XSH.hasExplanation)
+    def add_violations(
+        self,
+        pairs: Iterable[Tuple[ViolationSignature, ExplanationOutput]],
+        language: str = "en",
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Bulk version of add_violation for pre-computed (signature, explanation) pairs.
+        Signature hashing and JSON encoding are done up front, serially by default:
+        msgspec holds the GIL, so a thread pool only helps when the caller opts in
+        with max_workers > 1. The graph is only written from the calling thread,
+        and the KG is saved once at the end.
+        """
+        # Materialize once: the pairs are iterated by the preparation step and again below
+        pairs = list(pairs)
+
+        def prepare(pair):
+            sig, explanation = pair
+            return self.signature_to_uri(sig), self._encode_payloads(explanation)
+
+        if max_workers is not None and max_workers > 1 and len(pairs) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                prepared = list(executor.map(prepare, pairs))
+        else:
+            prepared = [prepare(pair) for pair in pairs]
+
+        with self.batch():
+            for (sig, explanation), (sig_uri, payloads) in zip(pairs, prepared):
+                self._insert_violation(sig_uri, sig, explanation, language, payloads)
+            self.save_kg()
+
+    @staticmethod
+    def _encode_payloads(explanation: ExplanationOutput) -> List[Tuple[URIRef, Literal]]:
+        """Encode the violation, justification tree and context of an explanation as JSON literals."""
+        stored_tree = None
+        if explanation.justification_tree:
+            stored_tree = _StoredJustificationTree(
+                justification=explanation.justification_tree.root,
+                violation=explanation.justification_tree.violation,
+            )
+        data_objects = [
+            (P_VIOLATION, explanation.violation),
+            (P_JUSTIFICATION_TREE, stored_tree),
+            (P_RETRIEVED_CONTEXT, explanation.retrieved_context),
+        ]
+
+        payloads = []
+        for predicate, data_object in data_objects:
+            if not data_object:
+                continue
+            try:
+                payloads.append((predicate, Literal(_json_encoder.encode(data_object).decode("utf-8"))))
+            except TypeError as e: logger.error(f"Failed to serialize {predicate}: {e}")
+            except Exception as e: logger.error(f"Unexpected error serializing {predicate}: {e}")
+        return payloads
+
+    def _insert_violation(
+        self,
+        sig_uri: URIRef,
+        sig: ViolationSignature,
+        explanation: ExplanationOutput,
+        language: str,
+        payloads: Optional[List[Tuple[URIRef, Literal]]] = None,
+    ):
+        """Write a violation into the graph; payloads are encoded here unless pre-computed."""
+        # The stored explanation may change below (new language, new model)
+        self._explanation_cache.pop(sig_uri, None)
+        # New triples are collected here and added in one go at the end
+        triples = []
+
+        # Check if an explanation node exists for this signature, create if not.
+        # The membership test doubles as has_violation's signature check; the
+        # caller computes sig_uri once and passes it in, so it is never rehashed.
+        expl_uri = self._value(sig_uri, P_HAS_EXPLANATION) if self._is_known(sig_uri) else None
         new_explanation_node = False
         if not expl_uri:
             new_explanation_node = True
             expl_uri = URIRef(str(sig_uri) + "_explanation") # Use a more predictable URI if needed
-            self.graph.add((sig_uri, RDF.type, XSH.ViolationSignature))
-            self.graph.add((expl_uri, RDF.type, XSH.Explanation))
-            self.graph.add((sig_uri, XSH.hasExplanation, expl_uri))
+            triples.append((sig_uri, P_TYPE, T_VIOLATION_SIG))
+            triples.append((expl_uri, P_TYPE, T_EXPLANATION))
+            triples.append((sig_uri, P_HAS_EXPLANATION, expl_uri))
             # Add signature components only when creating the signature node
-            self.graph.add((sig_uri, XSH.constraintComponent, Literal(sig.constraint_id)))
+            triples.append((sig_uri, P_CONSTRAINT_COMPONENT, Literal(sig.constraint_id)))
             if sig.property_path:
-                self.graph.add((sig_uri, XSH.propertyPath, Literal(sig.property_path)))
+                triples.append((sig_uri, P_PROPERTY_PATH, Literal(sig.property_path)))
             if sig.violation_type:
-                self.graph.add((sig_uri, XSH.violationType, Literal(str(sig.violation_type))))
+                triples.append((sig_uri, P_VIOLATION_TYPE, Literal(str(sig.violation_type))))
             if sig.constraint_params:
-                try:
-                    json_params = json.dumps(sig.constraint_params, sort_keys=True, default=str)
-                    self.graph.add((sig_uri, XSH.constraintParams, Literal(json_params)))
-                except TypeError as e:
-                    logger.error(f"Failed to serialize constraint_params for {sig_uri}: {e}")
+                json_params = sig.canonical_params.decode("utf-8")
+                triples.append((sig_uri, P_CONSTRAINT_PARAMS, Literal(json_params)))
 
         # --- Store natural language text (preventing duplicates for same lang) ---
         has_existing_nlt = any(
             isinstance(obj, Literal) and obj.language == language
-            for obj in self.graph.objects(expl_uri, XSH.naturalLanguageText)
+            for obj in self._objects(expl_uri, P_NATURAL_LANGUAGE_TEXT)
         )
         if not has_existing_nlt and explanation.natural_language_explanation:
-            self.graph.add((expl_uri, XSH.naturalLanguageText, Literal(explanation.natural_language_explanation, lang=language)))
+            triples.append((expl_uri, P_NATURAL_LANGUAGE_TEXT, Literal(explanation.natural_language_explanation, lang=language)))
 
         # --- Store correction suggestions (COMBINED, preventing duplicates for same lang) ---
         has_existing_suggestions_for_lang = any(
             isinstance(obj, Literal) and obj.language == language
-            for obj in self.graph.objects(expl_uri, XSH.correctionSuggestions)
+            for obj in self._objects(expl_uri, P_CORRECTION_SUGGESTIONS)
         )
         # Combine list into single string before adding
         if explanation.correction_suggestions and not has_existing_suggestions_for_lang:
@@ -256,40 +612,50 @@ class ViolationKnowledgeGraph:
                  suggestion_string_to_add = SUGGESTION_SEPARATOR.join(explanation.correction_suggestions)
             else: # Assume it's already the desired string format
                  suggestion_string_to_add = str(explanation.correction_suggestions) # Ensure string type
-            self.graph.add((expl_uri, XSH.correctionSuggestions, Literal(suggestion_string_to_add, lang=language)))
+            triples.append((expl_uri, P_CORRECTION_SUGGESTIONS, Literal(suggestion_string_to_add, lang=language)))
 
 
         # Add model info (overwriting previous value if necessary)
         if explanation.provided_by_model:
-            # Remove existing model info ONLY if it differs or only add if none exists?
-            # Simpler: remove and add ensures the latest model is recorded.
-            self.graph.remove((expl_uri, XSH.providedByModel, None))
-            self.graph.add((expl_uri, XSH.providedByModel, Literal(explanation.provided_by_model)))
+            # Replace the recorded model only when it changed, so re-adding the
+            # same model keeps the KG file append-only.
+            model_literal = Literal(explanation.provided_by_model)
+            recorded_models = self._objects(expl_uri, P_PROVIDED_BY_MODEL)
+            if model_literal not in recorded_models:
+                if recorded_models:
+                    self._remove(expl_uri, P_PROVIDED_BY_MODEL)
+                triples.append((expl_uri, P_PROVIDED_BY_MODEL, model_literal))
 
         # Store the complex data as JSON only when creating the explanation node for the first time
         if new_explanation_node:
-             # Helper to add JSON literal safely
-             def add_json_literal(predicate, data_object):
-                 if data_object and not self.graph.value(expl_uri, predicate):
-                     try:
-                         json_str = json.dumps(data_object.to_dict(), default=str)
-                         self.graph.add((expl_uri, predicate, Literal(json_str)))
-                     except AttributeError: logger.error(f"Object for {predicate} missing .to_dict() for {expl_uri}")
-                     except TypeError as e: logger.error(f"Failed to serialize {predicate} for {expl_uri}: {e}")
-                     except Exception as e: logger.error(f"Unexpected error serializing {predicate} for {expl_uri}: {e}")
+            if payloads is None:
+                payloads = self._encode_payloads(explanation)
+            for predicate, json_literal in payloads:
+                if not self._value(expl_uri, predicate):
+                    triples.append((expl_uri, predicate, json_literal))
 
-
-             add_json_literal(XSH.violation, explanation.violation)
-             add_json_literal(XSH.justificationTree, explanation.justification_tree)
-             add_json_literal(XSH.retrievedContext, explanation.retrieved_context)
+        self._add_all(triples)
 
     def clear(self):
-        """Clear the in-memory graph (excluding ontology potentially) and save."""
-        self.graph = rdflib.Graph()
-        self.graph.bind("xsh", XSH)
+        """Clear the in-memory instance data (the ontology is kept) and save."""
+        if self._persistent:
+            self.graph.remove((None, None, None))
+        else:
+            self.graph = rdflib.Graph()
+            self.graph.bind("xsh", XSH)
+        self._build_indexes()
+        self._explanation_cache.clear()
+        self._pending_triples = []
+        self._needs_rewrite = True
 
         self.save_kg() # Save the cleared (potentially empty) graph state
 
     def size(self) -> int:
-        """Return the number of triples in the graph."""
-        return len(self.graph)
\ No newline at end of file
+        """Return the number of instance triples in the graph (ontology excluded)."""
+        return len(self.graph)
+
+    def close(self):
+        """Flush and close a persistent store; a no-op for the in-memory graph."""
+        if self._persistent:
+            self.save_kg()
+            self.graph.close(commit_pending_transaction=True)
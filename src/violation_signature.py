@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
 from typing import Optional, Dict
 
+import orjson
+
 
 @dataclass(frozen=True)
 class ViolationSignature:
@@ -14,10 +16,26 @@ class ViolationSignature:
     violation_type: Optional[str] = None
     constraint_params: Dict[str, str] = field(default_factory=dict)
 
+    def __post_init__(self):
+        # Keep a private copy so later changes to the caller's dict cannot make
+        # equal signatures hash differently
+        params = dict(self.constraint_params or {})
+        object.__setattr__(self, "constraint_params", params)
+        object.__setattr__(self, "_canonical_params", _canonicalize(params))
+
+    @property
+    def canonical_params(self) -> bytes:
+        """Canonical (key-sorted) encoding of constraint_params, computed once."""
+        return self._canonical_params
+
     def __hash__(self):
-        sorted_params = tuple(sorted(self.constraint_params.items()))
         return hash(
-            (self.constraint_id, self.property_path, self.violation_type, sorted_params)
+            (
+                self.constraint_id,
+                self.property_path,
+                self.violation_type,
+                self._canonical_params,
+            )
         )
 
     def __eq__(self, other):
@@ -27,5 +45,18 @@ class ViolationSignature:
             self.constraint_id == other.constraint_id
             and self.property_path == other.property_path
             and self.violation_type == other.violation_type
-            and dict(self.constraint_params) == dict(other.constraint_params)
+            and self._canonical_params == other._canonical_params
+        )
+
+
+def _canonicalize(params: Dict) -> bytes:
+    """Encode params as key-sorted JSON, or a sorted repr for values orjson rejects."""
+    try:
+        return orjson.dumps(
+            params,
+            default=str,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
         )
+    except orjson.JSONEncodeError:
+        # e.g. integers beyond 64 bits
+        return repr(sorted((repr(k), repr(v)) for k, v in params.items())).encode("utf-8")
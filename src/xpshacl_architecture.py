@@ -5,9 +5,9 @@ This module defines the core data structures used throughout the xpSHACL system,
 including constraint violations, justification trees, and context information.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Union, get_args, get_origin, get_type_hints
 
 
 # --- Enums ---
@@ -28,8 +28,60 @@ NodeId = str
 ShapeId = str
 
 
+# --- Serialization helpers ---
+def fast_dict(cls=None, *, order: Optional[Sequence[str]] = None):
+    """
+    Class decorator that generates a specialized `to_dict` for a dataclass.
+
+    The method body is built once from the field annotations and compiled with
+    exec, so serialization is a single dict literal: Enum fields emit `.value`,
+    fields holding objects with `to_dict` are serialized recursively (guarded by
+    a truthiness check when Optional), and everything else is copied as is.
+    `order` optionally fixes the key order of the resulting dictionary; it must
+    name every field exactly once.
+    """
+
+    def wrap(cls):
+        hints = get_type_hints(cls)
+        field_names = [f.name for f in fields(cls)]
+        if order is not None and (len(order) != len(field_names) or set(order) != set(field_names)):
+            raise ValueError(
+                f"fast_dict order for {cls.__name__} must list each field exactly once: "
+                f"got {list(order)}, fields are {field_names}"
+            )
+        names = list(order) if order is not None else field_names
+        items = []
+        for name in names:
+            field_type, optional = hints[name], False
+            if get_origin(field_type) is Union and type(None) in get_args(field_type):
+                optional = True
+                field_type = next(a for a in get_args(field_type) if a is not type(None))
+            if isinstance(field_type, type) and issubclass(field_type, Enum):
+                expr = f"self.{name}.value"
+            elif isinstance(field_type, type) and hasattr(field_type, "to_dict"):
+                expr = f"self.{name}.to_dict()"
+            else:
+                items.append(f"        {name!r}: self.{name},")
+                continue
+            if optional:
+                expr = f"({expr} if self.{name} else None)"
+            items.append(f"        {name!r}: {expr},")
+
+        source = "def to_dict(self):\n    return {\n" + "\n".join(items) + "\n    }\n"
+        namespace: Dict = {}
+        exec(compile(source, f"<fast_dict {cls.__name__}>", "exec"), namespace)
+        to_dict = namespace["to_dict"]
+        to_dict.__qualname__ = f"{cls.__qualname__}.to_dict"
+        to_dict.__doc__ = f"Convert {cls.__name__} to a dictionary."
+        cls.to_dict = to_dict
+        return cls
+
+    return wrap(cls) if cls is not None else wrap
+
+
 # --- Data Classes ---
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class ConstraintViolation:
     """
     Represents a SHACL constraint violation.
@@ -46,20 +98,6 @@ class ConstraintViolation:
     severity: Optional[str] = None
     context: Dict = field(default_factory=dict)
 
-    def to_dict(self) -> Dict:
-        """Convert ConstraintViolation to a dictionary."""
-        return {
-            "focus_node": self.focus_node,
-            "shape_id": self.shape_id,
-            "constraint_id": self.constraint_id,
-            "violation_type": self.violation_type.value,  # Serialize Enum value
-            "property_path": self.property_path,
-            "value": self.value,
-            "message": self.message,
-            "severity": self.severity,
-            "context": self.context,
-        }
-
     @classmethod
     def from_dict(cls, data: Dict):
         """Create a ConstraintViolation from a dictionary."""
@@ -80,7 +118,7 @@ class ConstraintViolation:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class JustificationNode:
     """Represents a node in a justification tree."""
 
@@ -94,31 +132,50 @@ class JustificationNode:
         self.children.append(child)
 
     def to_dict(self) -> Dict:
-        """Convert node and its children to a dictionary"""
-        return {
+        """Convert node and its children to a dictionary (iteratively, so deep trees are safe)"""
+        result = {
             "statement": self.statement,
             "type": self.type,
             "evidence": self.evidence,
-            "children": [child.to_dict() for child in self.children],
+            "children": [],
         }
+        stack = [(self, result)]
+        while stack:
+            node, node_dict = stack.pop()
+            for child in node.children:
+                child_dict = {
+                    "statement": child.statement,
+                    "type": child.type,
+                    "evidence": child.evidence,
+                    "children": [],
+                }
+                node_dict["children"].append(child_dict)
+                stack.append((child, child_dict))
+        return result
 
     @classmethod
     def from_dict(cls, data: Dict):
-        """Create a JustificationNode from a dictionary."""
-        return cls(
+        """Create a JustificationNode (and its subtree) from a dictionary, iteratively."""
+        root = cls(
             statement=data["statement"],
             type=data["type"],
             evidence=data.get("evidence"),
-            children=[
-                cls.from_dict(child)
-                for child in data.get(
-                    "children",
-                )
-            ],
         )
+        stack = [(data, root)]
+        while stack:
+            node_data, node = stack.pop()
+            for child_data in node_data.get("children") or []:
+                child = cls(
+                    statement=child_data["statement"],
+                    type=child_data["type"],
+                    evidence=child_data.get("evidence"),
+                )
+                node.children.append(child)
+                stack.append((child_data, child))
+        return root
 
 
-@dataclass
+@dataclass(slots=True)
 class JustificationTree:
     """Represents a logical justification tree for a SHACL violation."""
 
@@ -141,7 +198,8 @@ class JustificationTree:
         )
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class DomainContext:
     """
     Captures contextual information relevant to a SHACL violation.
@@ -153,15 +211,6 @@ class DomainContext:
     similar_cases: List[Dict] = field(default_factory=list)
     domain_rules: List[str] = field(default_factory=list)
 
-    def to_dict(self) -> Dict:
-        """Convert DomainContext to a dictionary."""
-        return {
-            "ontology_fragments": self.ontology_fragments,
-            "shape_documentation": self.shape_documentation,
-            "similar_cases": self.similar_cases,
-            "domain_rules": self.domain_rules,
-        }
-
     @classmethod
     def from_dict(cls, data: Dict):
         """Create a DomainContext from a dictionary."""
@@ -181,7 +230,17 @@ class DomainContext:
         )
 
 
-@dataclass
+@fast_dict(
+    order=(
+        "violation",
+        "justification_tree",
+        "retrieved_context",
+        "natural_language_explanation",
+        "correction_suggestions",
+        "provided_by_model",
+    )
+)
+@dataclass(slots=True)
 class ExplanationOutput:
     """
     Represents the full output of the xpSHACL explanation system for a
@@ -195,21 +254,6 @@ class ExplanationOutput:
     retrieved_context: Optional[DomainContext] = None
     provided_by_model: Optional[str] = None
 
-    def to_dict(self) -> Dict:
-        """Convert to a dictionary for JSON output"""
-        return {
-            "violation": self.violation.to_dict() if self.violation else None,
-            "justification_tree": (
-                self.justification_tree.to_dict() if self.justification_tree else None
-            ),
-            "retrieved_context": (
-                self.retrieved_context.to_dict() if self.retrieved_context else None
-            ),
-            "natural_language_explanation": self.natural_language_explanation,
-            "correction_suggestions": self.correction_suggestions,
-            "provided_by_model": self.provided_by_model,
-        }
-
     @classmethod
     def from_dict(cls, data: Dict):
         """Create an ExplanationOutput from a dictionary."""
@@ -51,11 +51,6 @@ class TestExplanationGenerator(unittest.TestCase):
             JustificationNode("test", "test"), violation
         )
         context = DomainContext()
-        # Add some graph data to ensure json.dumps default=str handles them if needed
-        context.data_graph = Graph()
-        context.shapes_graph = Graph()
-        context.focus_node_context = {}
-        context.property_shape_context = {}
 
         # Call the method (uses default language 'en')
         explanation = self.explanation_generator._generate_explanation_text(
@@ -69,7 +64,7 @@ class TestExplanationGenerator(unittest.TestCase):
         expected_prompt = (
             f"Explain the following SHACL violation in {DEFAULT_TEST_LANGUAGE} (ISO 639-1 code): Test violation message. "
             f"Justification: {json.dumps(justification_tree.to_dict(), indent=2, default=str)}. "
-            f"Relevant context: {json.dumps(context.__dict__, indent=2, default=str)}. "
+            f"Relevant context: {json.dumps(context.to_dict(), indent=2, default=str)}. "
         )
         expected_prompt += explanations_prompt
 
@@ -102,9 +97,6 @@ class TestExplanationGenerator(unittest.TestCase):
             JustificationNode("test", "test"), violation
         )
         context = DomainContext()
-        # Minimal context for this test
-        context.data_graph = Graph()
-        context.shapes_graph = Graph()
 
         # Call the method (uses default language 'en')
         explanation = self.explanation_generator._generate_explanation_text(
@@ -118,7 +110,7 @@ class TestExplanationGenerator(unittest.TestCase):
         expected_prompt = (
             f"Explain the following SHACL violation in {DEFAULT_TEST_LANGUAGE} (ISO 639-1 code): Unknown violation. "
             f"Justification: {json.dumps(justification_tree.to_dict(), indent=2, default=str)}. "
-            f"Relevant context: {json.dumps(context.__dict__, indent=2, default=str)}. "
+            f"Relevant context: {json.dumps(context.to_dict(), indent=2, default=str)}. "
         )
         expected_prompt += explanations_prompt
 
@@ -146,8 +138,6 @@ class TestExplanationGenerator(unittest.TestCase):
             JustificationNode("test", "test"), violation
         )
         context = DomainContext()
-        context.data_graph = Graph()
-        context.shapes_graph = Graph()
 
         # Call the method (uses default language 'en')
         explanation = self.explanation_generator._generate_explanation_text(
@@ -2,10 +2,17 @@ import os
 import unittest
 from rdflib import Graph, URIRef, Literal
 from rdflib.namespace import RDF
-import sys, os, unittest, json
+import sys, os, unittest, json, tempfile
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
-from xpshacl_architecture import ExplanationOutput
+from xpshacl_architecture import (
+    ConstraintViolation,
+    DomainContext,
+    ExplanationOutput,
+    JustificationNode,
+    JustificationTree,
+    ViolationType,
+)
 from violation_kg import ViolationKnowledgeGraph, XSH
 from violation_signature import ViolationSignature
 from unittest.mock import patch, mock_open
@@ -41,6 +48,27 @@ class TestViolationKnowledgeGraph(unittest.TestCase):
             "Graph should contain 3 triples after manual addition",
         )
 
+    def test_direct_graph_changes_reach_lookups(self):
+        sig = ViolationSignature(
+            constraint_id="test_constraint",
+            property_path="test_property",
+            violation_type="test_type",
+            constraint_params={"key": "value"},
+        )
+        sig_uri = self.vkg.signature_to_uri(sig)
+        expl_uri = URIRef(str(sig_uri) + "_explanation")
+        self.vkg.clear()
+        self.vkg.graph.add((sig_uri, RDF.type, XSH.ViolationSignature))
+        self.vkg.graph.add((sig_uri, XSH.hasExplanation, expl_uri))
+        self.vkg.graph.add((expl_uri, XSH.naturalLanguageText, Literal("Manual", lang="en")))
+        self.assertTrue(self.vkg.has_violation(sig))
+        self.assertEqual(self.vkg.get_explanation(sig).natural_language_explanation, "Manual")
+
+        # Removing the signature node directly also drops the cached explanation
+        self.vkg.graph.remove((sig_uri, None, None))
+        self.assertFalse(self.vkg.has_violation(sig))
+        self.assertIsNone(self.vkg.get_explanation(sig))
+
     def test_add_violation_size(self):
         sig = ViolationSignature(
             constraint_id="test_constraint",
@@ -103,6 +131,204 @@ class TestViolationKnowledgeGraph(unittest.TestCase):
             [original_explanation.correction_suggestions],
         )
 
+    def test_batch_defers_save(self):
+        self.vkg.kg_path = os.path.join("data", "dummy_kg.ttl")
+        with patch("rdflib.Graph.serialize") as mock_serialize:
+            with self.vkg.batch():
+                self.vkg.clear()
+                with self.vkg.batch():
+                    self.vkg.save_kg()
+                mock_serialize.assert_not_called()
+            self.assertEqual(mock_serialize.call_count, 1)
+
+    def test_save_appends_new_triples(self):
+        sig = ViolationSignature(
+            constraint_id="test_constraint",
+            property_path="test_property",
+            violation_type="test_type",
+            constraint_params={"key": "value"},
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            self.vkg.kg_path = os.path.join(tmp_dir, "kg.nt")
+            self.vkg.clear()
+            self.vkg.add_violation(sig, ExplanationOutput("Test explanation"), "en")
+            self.vkg.save_kg()
+            with patch.object(self.vkg.graph, "serialize") as mock_serialize:
+                self.vkg.add_violation(sig, ExplanationOutput("Testerklärung"), "de")
+                self.vkg.save_kg()
+                # Only the delta is written, the full ABox is not re-serialized
+                mock_serialize.assert_not_called()
+
+            reloaded = Graph().parse(self.vkg.kg_path, format="nt")
+            self.assertEqual(len(reloaded), self.vkg.size())
+            self.assertTrue(self.vkg.graph.isomorphic(reloaded))
+
+    def test_save_rewrites_after_direct_graph_add(self):
+        sig = ViolationSignature(
+            constraint_id="test_constraint",
+            property_path="test_property",
+            violation_type="test_type",
+            constraint_params={"key": "value"},
+        )
+        manual = (URIRef("http://example.org/s"), URIRef("http://example.org/p"), Literal("o"))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            self.vkg.kg_path = os.path.join(tmp_dir, "kg.nt")
+            self.vkg.clear()
+            self.vkg.add_violation(sig, ExplanationOutput("Test explanation"), "en")
+            self.vkg.save_kg()
+            # Bypasses _pending_triples, so an append would drop it
+            self.vkg.graph.add(manual)
+            self.vkg.add_violation(sig, ExplanationOutput("Testerklärung"), "de")
+            self.vkg.save_kg()
+
+            reloaded = Graph().parse(self.vkg.kg_path, format="nt")
+            self.assertIn(manual, reloaded)
+            self.assertTrue(self.vkg.graph.isomorphic(reloaded))
+
+    def test_get_explanation_cached(self):
+        sig = ViolationSignature(
+            constraint_id="test_constraint",
+            property_path="test_property",
+            violation_type="test_type",
+            constraint_params={"key": "value"},
+        )
+        self.vkg.clear()
+        self.vkg.add_violation(sig, ExplanationOutput("Test explanation", provided_by_model="m1"))
+
+        first = self.vkg.get_explanation(sig)
+        self.assertIs(self.vkg.get_explanation(sig), first)
+
+        # Adding to the same signature invalidates the cached explanation
+        self.vkg.add_violation(sig, ExplanationOutput("Other", provided_by_model="m2"))
+        refreshed = self.vkg.get_explanation(sig)
+        self.assertIsNot(refreshed, first)
+        self.assertEqual(refreshed.provided_by_model, "m2")
+
+    def test_get_explanation_unknown_signature(self):
+        known = ViolationSignature(
+            constraint_id="test_constraint",
+            property_path="test_property",
+            violation_type="test_type",
+            constraint_params={"key": "value"},
+        )
+        unknown = ViolationSignature(
+            constraint_id="other_constraint",
+            property_path="test_property",
+            violation_type="test_type",
+            constraint_params={"key": "value"},
+        )
+        self.vkg.clear()
+        self.vkg.add_violation(known, ExplanationOutput("Test explanation"))
+
+        self.assertIsNone(self.vkg.get_explanation(unknown))
+        self.assertIsNone(self.vkg.get_explanation(unknown, "de"))
+        self.assertEqual(len(self.vkg._explanation_cache), 0)
+
+    def test_add_violations_bulk(self):
+        pairs = [
+            (
+                ViolationSignature(
+                    constraint_id=f"constraint_{i}",
+                    property_path="test_property",
+                    violation_type="test_type",
+                    constraint_params={"key": "value"},
+                ),
+                ExplanationOutput(
+                    natural_language_explanation=f"Explanation {i}",
+                    correction_suggestions=["Suggestion1", "Suggestion2"],
+                ),
+            )
+            for i in range(3)
+        ]
+
+        self.vkg.clear()
+        with patch.object(self.vkg, "save_kg") as mock_save:
+            self.vkg.add_violations(pairs, max_workers=2)
+        mock_save.assert_called_once()
+        self.assertEqual(self.vkg.size(), 3 * 9)
+        for sig, explanation in pairs:
+            self.assertEqual(
+                self.vkg.get_explanation(sig).natural_language_explanation,
+                explanation.natural_language_explanation,
+            )
+
+    def test_add_violations_accepts_generator(self):
+        pairs = (
+            (
+                ViolationSignature(
+                    constraint_id=f"constraint_{i}",
+                    property_path="test_property",
+                    violation_type="test_type",
+                    constraint_params={"key": "value"},
+                ),
+                ExplanationOutput(
+                    natural_language_explanation=f"Explanation {i}",
+                    correction_suggestions=["Suggestion1", "Suggestion2"],
+                ),
+            )
+            for i in range(3)
+        )
+
+        self.vkg.clear()
+        with patch.object(self.vkg, "save_kg"):
+            self.vkg.add_violations(pairs)
+        self.assertEqual(self.vkg.size(), 3 * 9)
+
+    def _round_trip(self, violation):
+        sig = ViolationSignature(
+            constraint_id="test_constraint",
+            property_path="test_property",
+            violation_type="test_type",
+            constraint_params={"key": "value"},
+        )
+        root = JustificationNode("conclusion", "conclusion")
+        root.add_child(JustificationNode("premise", "premise", evidence="From shape"))
+        tree = JustificationTree(root=root, violation=violation)
+        context = DomainContext(
+            ontology_fragments=["fragment"],
+            similar_cases=[{"focus_node": "ex:other"}],
+            domain_rules=["rule"],
+        )
+        self.vkg.clear()
+        self.vkg.add_violation(
+            sig,
+            ExplanationOutput(
+                natural_language_explanation="Test explanation",
+                violation=violation,
+                justification_tree=tree,
+                retrieved_context=context,
+            ),
+        )
+        retrieved = self.vkg.get_explanation(sig)
+        self.assertEqual(retrieved.violation, violation)
+        self.assertEqual(retrieved.justification_tree, tree)
+        self.assertEqual(retrieved.retrieved_context, context)
+
+    def test_get_explanation_round_trips_payloads(self):
+        self._round_trip(
+            ConstraintViolation(
+                focus_node="ex:node",
+                shape_id="ex:Shape",
+                constraint_id="sh:MinCountConstraintComponent",
+                violation_type=ViolationType.CARDINALITY,
+                property_path="ex:prop",
+                value="1",
+                context={"minCount": 1},
+            )
+        )
+
+    def test_get_explanation_round_trips_off_type_payloads(self):
+        # Values outside the annotations (here an int value) must still round-trip
+        self._round_trip(
+            ConstraintViolation(
+                focus_node="ex:node",
+                shape_id="ex:Shape",
+                constraint_id="sh:MinCountConstraintComponent",
+                violation_type=ViolationType.CARDINALITY,
+                value=5,
+            )
+        )
+
     def test_signature_to_uri(self):
         sig1 = ViolationSignature(
             constraint_id="test_constraint",
@@ -125,5 +351,123 @@ class TestViolationKnowledgeGraph(unittest.TestCase):
         self.assertTrue(str(uri2).startswith(str(XSH)))
 
 
+class TestPersistentViolationKnowledgeGraph(unittest.TestCase):
+    """Exercises the persistent-store code path with RDFLib's Memory store plugin."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.vkg = ViolationKnowledgeGraph(
+            ontology_path="dummy_ontology.ttl",
+            kg_path=os.path.join(self.tmp_dir.name, "kg_store"),
+            store="Memory",
+        )
+        self.sig = ViolationSignature(
+            constraint_id="test_constraint",
+            property_path="test_property",
+            violation_type="test_type",
+            constraint_params={"key": "value"},
+        )
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_add_save_load_clear_close(self):
+        self.vkg.add_violation(
+            self.sig, ExplanationOutput("Test explanation", provided_by_model="m1")
+        )
+        self.vkg.add_violation(
+            self.sig, ExplanationOutput("Testerklärung", provided_by_model="m2"), "de"
+        )
+        self.vkg.save_kg()
+        self.assertEqual(self.vkg.size(), 10)
+        # Triples stay in the store: no file is written, nothing is indexed in memory
+        self.assertFalse(os.path.isfile(self.vkg.kg_path))
+        self.assertEqual(self.vkg._index, {})
+
+        self.vkg.load_kg()
+        self.assertTrue(self.vkg.has_violation(self.sig, "de"))
+        explanation = self.vkg.get_explanation(self.sig, "de")
+        self.assertEqual(explanation.natural_language_explanation, "Testerklärung")
+        self.assertEqual(explanation.provided_by_model, "m2")
+
+        self.vkg.clear()
+        self.assertEqual(self.vkg.size(), 0)
+        self.assertFalse(self.vkg.has_violation(self.sig))
+        self.vkg.close()
+
+    def test_direct_store_changes_reach_lookups(self):
+        sig_uri = self.vkg.signature_to_uri(self.sig)
+        expl_uri = URIRef(str(sig_uri) + "_explanation")
+        self.vkg.graph.add((sig_uri, RDF.type, XSH.ViolationSignature))
+        self.vkg.graph.add((sig_uri, XSH.hasExplanation, expl_uri))
+        self.vkg.graph.add((expl_uri, XSH.naturalLanguageText, Literal("Manual", lang="en")))
+        self.assertTrue(self.vkg.has_violation(self.sig))
+        self.vkg.graph.remove((sig_uri, None, None))
+        self.assertFalse(self.vkg.has_violation(self.sig))
+        self.vkg.close()
+
+
+
+class TestViolationKnowledgeGraphFiles(unittest.TestCase):
+    """Round-trips real KG files (no parse mocking) with the shipped ontology."""
+
+    ontology_path = os.path.join(os.path.dirname(__file__), "..", "data", "xpshacl_ontology.ttl")
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.sig = ViolationSignature(
+            constraint_id="test_constraint",
+            property_path="test_property",
+            violation_type="test_type",
+            constraint_params={"key": "value"},
+        )
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _kg(self, kg_path):
+        return ViolationKnowledgeGraph(ontology_path=self.ontology_path, kg_path=kg_path)
+
+    def test_legacy_turtle_file_with_ontology(self):
+        source = self._kg(os.path.join(self.tmp_dir.name, "source.nt"))
+        self.assertGreater(len(source.tbox), 0)
+        source.add_violation(self.sig, ExplanationOutput("Test explanation", provided_by_model="m1"))
+        abox_size = source.size()
+
+        # KG files written before the TBox/ABox split hold both in one Turtle file
+        legacy_path = os.path.join(self.tmp_dir.name, "legacy_kg.ttl")
+        (source.tbox + source.graph).serialize(destination=legacy_path, format="turtle")
+
+        vkg = self._kg(legacy_path)
+        self.assertEqual(vkg.size(), abox_size)
+        self.assertTrue(vkg.has_violation(self.sig))
+
+        vkg.add_violation(self.sig, ExplanationOutput("Testerklärung"), "de")
+        vkg.save_kg()
+        reloaded = self._kg(legacy_path)
+        self.assertEqual(reloaded.size(), vkg.size())
+        self.assertTrue(reloaded.graph.isomorphic(vkg.graph))
+        self.assertTrue(reloaded.has_violation(self.sig, "de"))
+
+    def test_append_to_turtle_kg_file(self):
+        source = self._kg(os.path.join(self.tmp_dir.name, "source.nt"))
+        source.add_violation(self.sig, ExplanationOutput("Test explanation"))
+        kg_path = os.path.join(self.tmp_dir.name, "kg.ttl")
+        source.graph.serialize(destination=kg_path, format="turtle")
+
+        vkg = self._kg(kg_path)
+        self.assertTrue(vkg.has_violation(self.sig))
+        with patch.object(vkg.graph, "serialize") as mock_serialize:
+            vkg.add_violation(self.sig, ExplanationOutput("Testerklärung"), "de")
+            vkg.save_kg()
+            # N-Triples lines are valid Turtle, so the .ttl file is appended to
+            mock_serialize.assert_not_called()
+
+        reloaded = self._kg(kg_path)
+        self.assertTrue(reloaded.graph.isomorphic(vkg.graph))
+        self.assertTrue(reloaded.has_violation(self.sig, "en"))
+        self.assertTrue(reloaded.has_violation(self.sig, "de"))
+
+
 if __name__ == "__main__":
     unittest.main()
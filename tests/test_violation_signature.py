@@ -0,0 +1,58 @@
+import sys, os, unittest
+from dataclasses import asdict, fields
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from violation_signature import ViolationSignature
+from violation_kg import ViolationKnowledgeGraph
+from unittest.mock import patch
+
+
+class TestViolationSignature(unittest.TestCase):
+    def test_equal_signatures_hash_equal(self):
+        sig1 = ViolationSignature("c", "p", "t", {"a": "1", "b": "2"})
+        sig2 = ViolationSignature("c", "p", "t", {"b": "2", "a": "1"})
+        self.assertEqual(sig1, sig2)
+        self.assertEqual(hash(sig1), hash(sig2))
+        self.assertEqual(len({sig1, sig2}), 1)
+
+    def test_mutating_caller_params_does_not_affect_signature(self):
+        params = {"a": "1"}
+        sig = ViolationSignature("c", "p", "t", params)
+        before = hash(sig)
+        lookup = {sig: "value"}
+
+        params["a"] = "changed"
+
+        self.assertEqual(sig.constraint_params, {"a": "1"})
+        self.assertEqual(hash(sig), before)
+        self.assertEqual(lookup[ViolationSignature("c", "p", "t", {"a": "1"})], "value")
+
+    def test_params_beyond_json_range(self):
+        sig1 = ViolationSignature("c", "p", None, {"n": 2**70})
+        sig2 = ViolationSignature("c", "p", None, {"n": 2**70})
+        self.assertEqual(sig1, sig2)
+        self.assertEqual(hash(sig1), hash(sig2))
+        self.assertNotEqual(sig1, ViolationSignature("c", "p", None, {"n": 2**71}))
+
+    def test_canonical_params_is_not_a_field(self):
+        sig = ViolationSignature("c", "p", "t", {"a": "1"})
+        self.assertNotIn("canonical_params", [f.name for f in fields(sig)])
+        self.assertNotIn("_canonical_params", asdict(sig))
+        self.assertEqual(sig.canonical_params, b'{"a":"1"}')
+
+    @patch("rdflib.Graph.parse")
+    def test_uri_stable_across_instances(self, mock_parse):
+        vkg = ViolationKnowledgeGraph(
+            ontology_path="dummy_ontology.ttl", kg_path="dummy_kg.nt"
+        )
+        for params in ({"a": "1", "b": "2"}, {"n": 2**70}):
+            self.assertEqual(
+                vkg.signature_to_uri(ViolationSignature("c", "p", "t", dict(params))),
+                vkg.signature_to_uri(
+                    ViolationSignature("c", "p", "t", dict(reversed(list(params.items()))))
+                ),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
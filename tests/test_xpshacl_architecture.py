@@ -0,0 +1,174 @@
+import sys, os, unittest
+from dataclasses import dataclass
+from typing import Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from xpshacl_architecture import (
+    ConstraintViolation,
+    DomainContext,
+    ExplanationOutput,
+    JustificationNode,
+    JustificationTree,
+    ViolationType,
+    fast_dict,
+)
+
+
+class TestFastDict(unittest.TestCase):
+    def setUp(self):
+        self.violation = ConstraintViolation(
+            focus_node="ex:node",
+            shape_id="ex:Shape",
+            constraint_id="sh:MinCountConstraintComponent",
+            violation_type=ViolationType.CARDINALITY,
+            property_path="ex:prop",
+            value="1",
+            message="Too few values",
+            context={"minCount": 1},
+        )
+        self.context = DomainContext(
+            ontology_fragments=["fragment"],
+            similar_cases=[{"focus_node": "ex:other"}],
+            domain_rules=["rule"],
+        )
+        self.tree = JustificationTree(
+            root=JustificationNode("conclusion", "conclusion"), violation=self.violation
+        )
+
+    def test_constraint_violation_to_dict(self):
+        self.assertEqual(
+            self.violation.to_dict(),
+            {
+                "focus_node": "ex:node",
+                "shape_id": "ex:Shape",
+                "constraint_id": "sh:MinCountConstraintComponent",
+                "violation_type": "cardinality",  # Enum serialized by value
+                "property_path": "ex:prop",
+                "value": "1",
+                "message": "Too few values",
+                "severity": None,
+                "context": {"minCount": 1},
+            },
+        )
+
+    def test_domain_context_to_dict(self):
+        self.assertEqual(
+            self.context.to_dict(),
+            {
+                "ontology_fragments": ["fragment"],
+                "shape_documentation": [],
+                "similar_cases": [{"focus_node": "ex:other"}],
+                "domain_rules": ["rule"],
+            },
+        )
+
+    def test_explanation_output_to_dict(self):
+        explanation = ExplanationOutput(
+            natural_language_explanation="Explanation",
+            correction_suggestions="Fix it",
+            violation=self.violation,
+            justification_tree=self.tree,
+            retrieved_context=self.context,
+            provided_by_model="model",
+        )
+        result = explanation.to_dict()
+        self.assertEqual(
+            list(result),
+            [
+                "violation",
+                "justification_tree",
+                "retrieved_context",
+                "natural_language_explanation",
+                "correction_suggestions",
+                "provided_by_model",
+            ],
+        )
+        self.assertEqual(result["violation"], self.violation.to_dict())
+        self.assertEqual(result["justification_tree"], self.tree.to_dict())
+        self.assertEqual(result["retrieved_context"], self.context.to_dict())
+        self.assertEqual(result["natural_language_explanation"], "Explanation")
+        self.assertEqual(result["correction_suggestions"], "Fix it")
+        self.assertEqual(result["provided_by_model"], "model")
+
+    def test_explanation_output_to_dict_optional_none(self):
+        self.assertEqual(
+            ExplanationOutput(natural_language_explanation="Explanation").to_dict(),
+            {
+                "violation": None,
+                "justification_tree": None,
+                "retrieved_context": None,
+                "natural_language_explanation": "Explanation",
+                "correction_suggestions": None,
+                "provided_by_model": None,
+            },
+        )
+
+    def test_optional_enum_field(self):
+        @fast_dict
+        @dataclass
+        class WithOptionalEnum:
+            kind: Optional[ViolationType] = None
+
+        self.assertEqual(WithOptionalEnum().to_dict(), {"kind": None})
+        self.assertEqual(
+            WithOptionalEnum(ViolationType.PATTERN).to_dict(), {"kind": "pattern"}
+        )
+
+    def test_order_must_cover_all_fields(self):
+        with self.assertRaises(ValueError):
+
+            @fast_dict(order=("a",))
+            @dataclass
+            class MissingField:
+                a: int
+                b: int
+
+        with self.assertRaises(ValueError):
+
+            @fast_dict(order=("a", "b", "c"))
+            @dataclass
+            class UnknownField:
+                a: int
+                b: int
+
+
+class TestJustificationNodeSerialization(unittest.TestCase):
+    def test_round_trip_preserves_child_order(self):
+        root = JustificationNode("root", "conclusion")
+        for i in range(3):
+            child = JustificationNode(f"child {i}", "premise", evidence=f"evidence {i}")
+            child.add_child(JustificationNode(f"grandchild {i}", "observation"))
+            root.add_child(child)
+
+        data = root.to_dict()
+        self.assertEqual(
+            [child["statement"] for child in data["children"]],
+            ["child 0", "child 1", "child 2"],
+        )
+        self.assertEqual(JustificationNode.from_dict(data), root)
+
+    def test_deep_tree_round_trip(self):
+        # Deeper than the default recursion limit: must not raise RecursionError
+        depth = sys.getrecursionlimit() * 5
+        root = JustificationNode("level 0", "conclusion")
+        node = root
+        for level in range(1, depth + 1):
+            child = JustificationNode(f"level {level}", "premise")
+            node.add_child(child)
+            node.add_child(JustificationNode(f"leaf {level}", "observation"))
+            node = child
+
+        restored = JustificationNode.from_dict(root.to_dict())
+
+        node = restored
+        for level in range(1, depth + 1):
+            self.assertEqual(
+                [child.statement for child in node.children],
+                [f"level {level}", f"leaf {level}"],
+            )
+            node = node.children[0]
+        self.assertEqual(node.children, [])
+
+
+if __name__ == "__main__":
+    unittest.main()